@@ -1,7 +1,11 @@
 from django.contrib import admin
-from .models import OdooContact
+from .models import OdooContact, SyncCursor
 
 @admin.register(OdooContact)
 class OdooContactAdmin(admin.ModelAdmin):
     list_display = ('name', 'email', 'phone', 'last_synced')
     search_fields = ('name', 'email')
+
+@admin.register(SyncCursor)
+class SyncCursorAdmin(admin.ModelAdmin):
+    list_display = ('key', 'value')
@@ -1,184 +1,792 @@
+import asyncio
+import contextlib
+import datetime
+import hashlib
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+import aiohttp # Async HTTP client for the ODOO_ASYNC fetch path
+import msgpack # Optional MessagePack wire format (settings.ODOO_TRANSPORT = 'msgpack')
+import orjson # Fast JSON encoding/decoding of JSON-RPC payloads and replies, search_read pages included
 import requests # For making HTTP requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from asgiref.sync import async_to_sync, sync_to_async
 from django_cron import CronJobBase, Schedule
 from django.conf import settings
-from odoo_sync.models import OdooContact
-# Use request_json to build the payload, and parse_json to parse the response.
+from django.core.cache import cache
+from django.db import models, transaction
+from django.utils import timezone
+from odoo_sync.models import OdooContact, SyncCursor
+# Use parse to turn the decoded response into Ok/Error objects.
 # Ok and Error are used to check the parsed response.
-from jsonrpcclient import Error, Ok, parse_json 
-from jsonrpcclient.requests import request_json # Correct way to get request_json
+from jsonrpcclient import Error, Ok, parse
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared HTTP session used to talk to Odoo.
+ODOO_POOL_CONNECTIONS = 4
+ODOO_POOL_MAXSIZE = 10
+
+# Connection limit of the aiohttp connector used when settings.ODOO_ASYNC is enabled.
+ODOO_ASYNC_CONNECTION_LIMIT = 16
+
+# Content-Type/Accept sent for each settings.ODOO_TRANSPORT. Stock Odoo only speaks 'json';
+# 'msgpack' is for endpoints fronted by a MessagePack JSON-RPC bridge.
+ODOO_CONTENT_TYPES = {'json': 'application/json', 'msgpack': 'application/msgpack'}
+
+# How long a UID returned by Odoo's login is reused before logging in again.
+ODOO_UID_CACHE_TIMEOUT = 60 * 60 * 12
+
+# search_read page size, and how many pages are fetched at once over the shared session.
+# Keep the worker count at or below ODOO_POOL_MAXSIZE so every worker gets a pooled connection.
+ODOO_PAGE_SIZE = 500
+ODOO_FETCH_WORKERS = 8
+
+# First Odoo major version whose search_read accepts load=None (Many2one fields as bare ids).
+# Older servers reject the extra keyword, so they are sent no load and answer with [id, display_name] pairs.
+ODOO_LOAD_NONE_MIN_VERSION = 15
+
+# res.partner fields read from Odoo.
+FIELDS_TO_FETCH = ['id', 'name', 'email', 'phone', 'street', 'city', 'zip', 'country_id']
+
+# SyncCursor key holding the Odoo server time up to which res.partner changes have been synced.
+PARTNER_CURSOR_KEY = 'res.partner.write_date'
+# How far before the snapshot the next run starts. Odoo stamps write_date with the start time of the
+# writing transaction, and the Date header may come from a proxy with its own clock, so a partner can
+# show up after a run with a write_date just under that run's snapshot. Re-pulled unchanged rows are
+# skipped by the content hash check.
+PARTNER_CURSOR_OVERLAP = datetime.timedelta(minutes=10)
+
+# Odoo's datetime string format, e.g. for write_date.
+ODOO_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# (OdooContact field, Odoo res.partner field) pairs copied as-is; country is derived from country_id.
+_FIELD_MAP = (
+    ('name', 'name'),
+    ('email', 'email'),
+    ('phone', 'phone'),
+    ('street', 'street'),
+    ('city', 'city'),
+    ('zip_code', 'zip'),
+)
+
+# OdooContact fields that may be cleared (NULL) when Odoo has no value for them.
+_CLEARABLE_FIELDS = frozenset(('email', 'phone', 'street', 'city', 'zip_code', 'country'))
+
+# Rows per INSERT/UPDATE statement (and per odoo_id__in lookup) when writing contacts.
+DB_BATCH_SIZE = 500
+# OdooContact columns rewritten with Odoo's values when an existing contact changed.
+SYNCED_FIELDS = ['name', 'email', 'phone', 'street', 'city', 'zip_code', 'country', 'content_hash', 'last_synced']
+# (max_length, null) of the synced text columns. Rows breaking them are skipped before writing:
+# SQLite doesn't enforce max_length, and on PostgreSQL one such row would fail the whole transaction.
+_TEXT_FIELD_LIMITS = {
+    field.name: (field.max_length, field.null)
+    for field in OdooContact._meta.get_fields()
+    if isinstance(field, models.CharField) and field.name in SYNCED_FIELDS
+}
+
 class SyncOdooContactsCronJob(CronJobBase):
     RUN_EVERY_MINS = 1440  # Run once a day
     code = 'odoo_sync.sync_odoo_contacts_cron_job'
     schedule = Schedule(run_every_mins=RUN_EVERY_MINS)
 
-    def _make_odoo_request(self, url, method, service=None, **params):
+    def __init__(self):
+        super().__init__()
+        self.session = None
+        self.transport = 'json'
+        self.odoo_semaphore = None # Caps in-flight aiohttp requests when set (see odoo_sync.scheduler)
+        # JSON-RPC request ids; unique per job instance so concurrent requests never share one
+        self._id_counter = itertools.count(1)
+
+    def _build_session(self):
         """
-        Helper function to make a JSON-RPC request to Odoo.
+        Build a pooled HTTP session so every JSON-RPC call of a run reuses the
+        same keep-alive connection instead of paying a new TCP/TLS handshake.
+        """
+        session = requests.Session()
+        # Payloads are serialized up front (_encode_payload) and sent as raw bytes, so set the content type once here
+        session.headers['Content-Type'] = ODOO_CONTENT_TYPES[self.transport]
+        session.headers['Accept'] = ODOO_CONTENT_TYPES[self.transport]
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(['POST']), # JSON-RPC calls are all POSTs; the ones we make are read-only
+            raise_on_status=False, # Let raise_for_status() report the final response as before
+        )
+        adapter = HTTPAdapter(
+            pool_connections=ODOO_POOL_CONNECTIONS,
+            pool_maxsize=ODOO_POOL_MAXSIZE,
+            max_retries=retries,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _build_odoo_payload(self, method, service=None, **params):
+        """
+        Build the JSON-RPC request dict for a single Odoo call.
         """
+        # The payload shape never varies, so it is written out directly rather than going through
+        # jsonrpcclient's request builders.
         # For 'common' service (login), the structure is slightly different
         if service == 'common' and method == 'login':
             # Odoo's login method expects db, login, password as direct params in the call
-            payload = request_json(method, params=params)
-        else:
-            # For 'object' service (execute_kw), structure includes service, method, and args/kwargs
-             payload = request_json(
-                "call",  # This is the JSON-RPC method for execute_kw style calls
-                params={
-                    "service": service,
-                    "method": method,
-                    "args": [
-                        params.get('db'),
-                        params.get('uid'),
-                        params.get('password'),
-                        params.get('model'),
-                        params.get('operation'), # e.g., 'search_read'
-                        params.get('domain', []),
-                        params.get('kwargs', {})
-                    ],
-                },
-            )
-        
+            return {"jsonrpc": "2.0", "method": method, "params": params, "id": next(self._id_counter)}
+        if service == 'common' and method == 'version':
+            # Takes neither arguments nor credentials
+            return {"jsonrpc": "2.0", "method": "call", "params": {"service": service, "method": method, "args": []}, "id": next(self._id_counter)}
+        # For 'object' service (execute_kw), structure includes service, method, and args/kwargs
+        return {
+            "jsonrpc": "2.0",
+            "method": "call",  # This is the JSON-RPC method for execute_kw style calls
+            "params": {
+                "service": service,
+                "method": method,
+                "args": [
+                    params.get('db'),
+                    params.get('uid'),
+                    params.get('password'),
+                    params.get('model'),
+                    params.get('operation'), # e.g., 'search_read'
+                    params.get('domain', []),
+                    params.get('kwargs', {})
+                ],
+            },
+            "id": next(self._id_counter),
+        }
+
+    def _encode_payload(self, payload):
+        """
+        Serialize a JSON-RPC payload for the configured transport.
+        """
+        if self.transport == 'msgpack':
+            return msgpack.packb(payload, use_bin_type=True)
+        return orjson.dumps(payload)
+
+    def _decode_body(self, body):
+        """
+        Deserialize a buffered response body for the configured transport.
+        Every reply goes through here, so the large search_read pages are decoded by orjson (or msgpack) too.
+        """
+        if self.transport == 'msgpack':
+            return msgpack.unpackb(body, raw=False)
+        return orjson.loads(body)
+
+    def _make_odoo_request(self, url, method, service=None, **params):
+        """
+        Helper function to make a JSON-RPC request to Odoo.
+        """
+        payload = self._build_odoo_payload(method, service, **params)
+        return self._post_odoo(url, payload, method)
+
+    def _post_odoo(self, url, payload, method):
+        """
+        POST a JSON-RPC request dict and parse the reply.
+        """
         try:
-            response = requests.post(url, json=payload, timeout=20) # Increased timeout
+            response = self.session.post(url, data=self._encode_payload(payload), timeout=20) # Increased timeout
             response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-            # It's important to use response.text with parse_json, not response.json()
-            return parse_json(response.text) 
+            # Decode the raw bytes once and hand the dict to jsonrpcclient
+            return parse(self._decode_body(response.content))
         except requests.exceptions.Timeout:
-            logger.error(f"Timeout during Odoo request to {url} for method {method}")
+            logger.error("Timeout during Odoo request to %s for method %s", url, method)
             return None # Or an Error object
         except requests.exceptions.HTTPError as e:
             # Log a more controlled message using attributes from e.response
-            error_details = f"Status {e.response.status_code} {e.response.reason}."
             # Include a snippet of response text if it's not too long or binary
             try:
                 response_text_snippet = e.response.text[:200] # Limit snippet length
             except Exception:
                 response_text_snippet = "[Could not get response text]"
-            logger.error(f"HTTP error during Odoo request to {url}: {error_details} Response text snippet: {response_text_snippet}")
+            logger.error(
+                "HTTP error during Odoo request to %s: Status %s %s. Response text snippet: %s",
+                url, e.response.status_code, e.response.reason, response_text_snippet
+            )
             
             # Attempt to parse error response from Odoo if available (useful if Odoo returns JSON error for HTTP error status)
-            if e.response is not None and e.response.text:
+            if e.response is not None and e.response.content:
                 try:
-                    return parse_json(e.response.text)
+                    return parse(self._decode_body(e.response.content))
                 except Exception as parse_e: # JSONDecodeError or other parsing issue
-                    logger.error(f"Could not parse error response from Odoo: {parse_e}")
+                    logger.error("Could not parse error response from Odoo: %s", parse_e)
             return None # Or an Error object
         except requests.exceptions.RequestException as e: # Catch other request exceptions
-            logger.error(f"Request exception during Odoo request to {url}: {e}")
+            logger.error("Request exception during Odoo request to %s: %s", url, e)
             return None # Or an Error object
         except Exception as e: # Catch other errors like JSON parsing issues from valid HTTP responses
-             logger.error(f"Error processing Odoo request or response ({url}, {method}): {e}")
+             logger.error("Error processing Odoo request or response (%s, %s): %s", url, method, e)
              return None
 
+    def _server_info(self, url):
+        """
+        Call common.version and return (server time, major version). The time is Odoo's current
+        time as a write_date string, read from the reply's Date header; either item is None if it
+        could not be read.
+        """
+        payload = self._build_odoo_payload("version", "common")
+        try:
+            response = self.session.post(url, data=self._encode_payload(payload), timeout=20)
+        except requests.exceptions.RequestException as e:
+            logger.error("Request exception during Odoo request to %s: %s", url, e)
+            return None, None
+        return self._write_date_from_http_date(response.headers.get('Date')), self._major_version(response.content)
 
-    def do(self):
-        logger.info("Starting Odoo contacts synchronization cron job.")
+    def _major_version(self, body):
+        """
+        Return the major version from a common.version reply body, or None if it can't be read.
+        """
+        try:
+            major = self._decode_body(body)['result']['server_version_info'][0]
+            return int(str(major).rsplit('~', 1)[-1]) # Odoo Online reports e.g. 'saas~17'
+        except Exception:
+            return None
 
-        ODOO_URL = getattr(settings, 'ODOO_URL', None)
-        ODOO_DB = getattr(settings, 'ODOO_DB', None)
-        ODOO_USERNAME = getattr(settings, 'ODOO_USERNAME', None)
-        ODOO_PASSWORD = getattr(settings, 'ODOO_PASSWORD', None)
+    def _sends_bare_ids(self, major_version):
+        """
+        Whether partner pages are requested with load=None, i.e. whether the server supports it.
+        """
+        return major_version is not None and major_version >= ODOO_LOAD_NONE_MIN_VERSION
 
-        if not all([ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD]):
-            logger.error("Odoo connection parameters are not fully configured in settings.")
-            return
+    @staticmethod
+    def _write_date_from_http_date(http_date):
+        """
+        Convert an HTTP Date header ('Mon, 02 Jun 2025 10:00:00 GMT') to Odoo's UTC write_date
+        format ('2025-06-02 10:00:00'), or None if it is missing or malformed.
+        """
+        if not http_date:
+            return None
+        try:
+            server_time = parsedate_to_datetime(http_date)
+        except (TypeError, ValueError):
+            return None
+        if server_time.tzinfo is None: # '-0000' zone: UTC
+            server_time = server_time.replace(tzinfo=datetime.timezone.utc)
+        return server_time.astimezone(datetime.timezone.utc).strftime(ODOO_DATETIME_FORMAT)
+
+    def _uid_cache_key(self, auth_params):
+        return f"odoo_uid:{auth_params['db']}:{auth_params['login']}"
+
+    def _authenticate(self, auth_url, auth_params, force=False):
+        """
+        Return the Odoo UID for the configured user, logging in only when no
+        cached UID is available (or when ``force`` is set).
+        Returns None if authentication failed.
+        """
+        cache_key = self._uid_cache_key(auth_params)
+        if force:
+            cache.delete(cache_key)
+        else:
+            uid = cache.get(cache_key)
+            if uid:
+                logger.info("Using cached Odoo UID: %s", uid)
+                return uid
 
-        # Odoo Authentication
-        auth_url = f"{ODOO_URL}/jsonrpc"
-        uid = None
-        
-        auth_params = {
-            "db": ODOO_DB,
-            "login": ODOO_USERNAME,
-            "password": ODOO_PASSWORD
-        }
         # The 'login' method is part of the 'common' service (or sometimes 'db' service in older Odoo versions)
-        # jsonrpcclient.request_json will build the full JSON-RPC request structure.
         # The actual RPC method Odoo expects here is 'login' (or 'authenticate').
         parsed_response = self._make_odoo_request(auth_url, method="login", service="common", **auth_params)
+        uid = self._uid_from_login_response(parsed_response)
+        if uid:
+            cache.set(cache_key, uid, timeout=ODOO_UID_CACHE_TIMEOUT)
+        return uid
 
+    def _uid_from_login_response(self, parsed_response):
+        """
+        Extract the UID from a parsed login response, logging why it failed otherwise.
+        """
         if parsed_response is None: # Error handled and logged by _make_odoo_request
-            return
+            return None
         if isinstance(parsed_response, Ok):
             uid = parsed_response.result
             if not uid and isinstance(uid, bool): # Specifically if uid is False (boolean)
-                logger.error(f"Odoo authentication failed. Odoo responded with 'False' for UID. Full response result: {parsed_response.result}")
-                return
+                logger.error("Odoo authentication failed. Odoo responded with 'False' for UID. Full response result: %s", parsed_response.result)
+                return None
             elif not uid: # Other falsy UIDs (e.g. None, 0, empty string), less common for login success
-                logger.error(f"Odoo authentication failed. UID received: {uid}. Full response result: {parsed_response.result}")
-                return
-            logger.info(f"Successfully authenticated with Odoo. UID: {uid}")
+                logger.error("Odoo authentication failed. UID received: %s. Full response result: %s", uid, parsed_response.result)
+                return None
+            logger.info("Successfully authenticated with Odoo. UID: %s", uid)
         else: # Error object
-            logger.error(f"Odoo authentication failed. Error: {parsed_response.message} Data: {getattr(parsed_response, 'data', None)}")
+            logger.error("Odoo authentication failed. Error: %s Data: %s", parsed_response.message, getattr(parsed_response, 'data', None))
+            return None
+        return uid
+
+    def _is_access_denied(self, parsed_response):
+        """
+        Whether Odoo rejected a call because of the credentials/UID it was made with.
+        """
+        if not isinstance(parsed_response, Error):
+            return False
+        error_data = parsed_response.data if isinstance(parsed_response.data, dict) else {}
+        return str(error_data.get('name', '')).endswith('AccessDenied')
+
+    def _load_transport(self):
+        """
+        Read settings.ODOO_TRANSPORT into self.transport. Returns False (and logs) if it is not supported.
+        """
+        self.transport = getattr(settings, 'ODOO_TRANSPORT', 'json')
+        if self.transport not in ODOO_CONTENT_TYPES:
+            logger.error("Unsupported ODOO_TRANSPORT setting: %s. Expected one of: %s", self.transport, ", ".join(ODOO_CONTENT_TYPES))
+            return False
+        return True
+
+    def do(self):
+        if getattr(settings, 'ODOO_ASYNC', False):
+            # Fetch over aiohttp on an event loop; the database writes still run in this thread
+            async_to_sync(self._async_do)()
             return
-        
-        if not uid: # Should be redundant if above logic is correct
-            logger.error("Odoo authentication failed, UID not obtained.")
+        if not self._load_transport():
+            return
+        self.session = self._build_session()
+        try:
+            self._sync()
+        finally:
+            self.session.close()
+            self.session = None
+
+    def _get_odoo_settings(self):
+        """
+        Return (url, db, username, password) from settings, or None if any of them is missing.
+        """
+        odoo_settings = (
+            getattr(settings, 'ODOO_URL', None),
+            getattr(settings, 'ODOO_DB', None),
+            getattr(settings, 'ODOO_USERNAME', None),
+            getattr(settings, 'ODOO_PASSWORD', None),
+        )
+        if not all(odoo_settings):
+            logger.error("Odoo connection parameters are not fully configured in settings.")
+            return None
+        return odoo_settings
+
+    def _sync(self):
+        logger.info("Starting Odoo contacts synchronization cron job.")
+
+        odoo_settings = self._get_odoo_settings()
+        if odoo_settings is None:
+            return
+        ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD = odoo_settings
+
+        # Odoo Authentication
+        auth_url = f"{ODOO_URL}/jsonrpc"
+        auth_params = {
+            "db": ODOO_DB,
+            "login": ODOO_USERNAME,
+            "password": ODOO_PASSWORD
+        }
+        uid = self._authenticate(auth_url, auth_params)
+        if not uid: # Error handled and logged by _authenticate
             return
 
         # Data Fetching
         models_url = f"{ODOO_URL}/jsonrpc" # Same URL for object calls
-        fields_to_fetch = ['id', 'name', 'email', 'phone', 'street', 'city', 'zip', 'country_id']
-        
-        fetch_params = {
+        # Taken before search_count: the pull is bounded by it and the cursor moves to it afterwards
+        snapshot, major_version = self._server_info(models_url)
+        if snapshot is None:
+            logger.warning("Could not read Odoo's server time; the sync cursor will not be advanced this run.")
+        domain = self._partner_domain(snapshot) # Only partners changed since the last sync, or all of them on the first run
+
+        count_params = {
             'db': ODOO_DB,
             'uid': uid,
             'password': ODOO_PASSWORD, # Odoo requires password for execute_kw calls
             'model': 'res.partner',
-            'operation': 'search_read', # This is the Odoo model method
-            'domain': [], # Domain to fetch all partners
-            'kwargs': {'fields': fields_to_fetch}
+            'operation': 'search_count', # Sizes the pagination below
+            'domain': domain,
         }
         # 'execute_kw' is the method on Odoo's 'object' service
-        contacts_response = self._make_odoo_request(models_url, method="execute_kw", service="object", **fetch_params)
+        count_response = self._make_odoo_request(models_url, method="execute_kw", service="object", **count_params)
+
+        if self._is_access_denied(count_response):
+            # The cached UID may be stale (user recreated, database restored...); log in again once and retry
+            logger.info("Odoo denied access with the current UID, re-authenticating.")
+            uid = self._authenticate(auth_url, auth_params, force=True)
+            if not uid:
+                return
+            count_params['uid'] = uid
+            count_response = self._make_odoo_request(models_url, method="execute_kw", service="object", **count_params)
+
+        if count_response is None: # Error handled by _make_odoo_request
+            return
+        if not isinstance(count_response, Ok): # Error object
+            logger.error("Failed to fetch contacts from Odoo. Error: %s Data: %s", count_response.message, getattr(count_response, 'data', None))
+            return
+
+        fetch_params = {
+            'db': ODOO_DB,
+            'uid': uid,
+            'password': ODOO_PASSWORD,
+            'model': 'res.partner',
+            'operation': 'search_read', # This is the Odoo model method
+            'domain': domain,
+        }
+        bare_ids = self._sends_bare_ids(major_version)
+        page_kwargs = self._build_page_kwargs(count_response.result, bare_ids)
+        countries = {}
+        if page_kwargs and bare_ids: # Otherwise partners carry the country name themselves
+            countries = self._fetch_countries(models_url, fetch_params)
+            if countries is None: # Error handled and logged by _fetch_countries
+                return
+        contacts_data = self._fetch_pages(models_url, fetch_params, page_kwargs)
+        if contacts_data is None: # Error handled and logged by _fetch_pages
+            return
+        logger.info("Successfully fetched %s contacts from Odoo.", len(contacts_data))
+
+        self._write_contacts(contacts_data, countries, snapshot)
+
+    def _build_page_kwargs(self, total_count, bare_ids):
+        """
+        Return the search_read kwargs for each page needed to read ``total_count`` partners.
+        """
+        # Pages are fetched concurrently, so they need a stable order to neither overlap nor leave gaps.
+        page_kwargs = {'fields': FIELDS_TO_FETCH, 'limit': ODOO_PAGE_SIZE, 'order': 'id'}
+        if bare_ids:
+            # load=None makes Odoo return Many2one fields as a bare id instead of [id, display_name].
+            page_kwargs['load'] = None
+        return [{**page_kwargs, 'offset': offset} for offset in range(0, total_count, ODOO_PAGE_SIZE)]
+
+    def _partner_domain(self, snapshot):
+        """
+        Return the res.partner search domain for this run: partners written from the stored
+        cursor (or ever, on the first run) up to, but excluding, the ``snapshot`` server time.
+        """
+        cursor = SyncCursor.objects.filter(key=PARTNER_CURSOR_KEY).first()
+        if snapshot is None:
+            # No upper bound available; the cursor isn't advanced either (see _write_contacts)
+            return [] if cursor is None else [['write_date', '>=', cursor.value]]
+        # Pages are read by offset after a search_count, so the matching set must not change meanwhile:
+        # a partner edited during the run gets a write_date at or after the snapshot and is left out,
+        # instead of shifting later partners past the last counted page. The next run starts
+        # PARTNER_CURSOR_OVERLAP before the snapshot, so it also picks up partners committed late.
+        if cursor is None:
+            # write_date can be empty on rows inserted outside the ORM; they still belong in the full pull
+            return ['|', ['write_date', '=', False], ['write_date', '<', snapshot]]
+        return [['write_date', '>=', cursor.value], ['write_date', '<', snapshot]]
+
+    def _write_contacts(self, contacts_data, countries, snapshot):
+        """
+        Create/update OdooContact rows from the fetched partner records and
+        advance the write_date cursor to ``snapshot`` minus PARTNER_CURSOR_OVERLAP (left as is when None).
+        """
+        contact_values = self._build_contact_values(contacts_data, countries)
+        # Partners OdooContact can't store are logged and left out, so one bad row doesn't roll back the whole sync
+        for odoo_id, values in list(contact_values.items()):
+            problem = self._invalid_field(values)
+            if problem:
+                logger.error("Skipping Odoo contact %s: %s", odoo_id, problem)
+                del contact_values[odoo_id]
+
+        # Split into brand new rows and existing rows whose synced values changed; unchanged rows aren't touched at all.
+        # Model instances are only built for rows that get written: OdooContact.__init__ is most of the per-row cost.
+        existing_rows = self._existing_rows(list(contact_values))
+        to_create = []
+        to_update = []
+        now = timezone.now()
+        for odoo_id, values in contact_values.items():
+            existing = existing_rows.get(odoo_id)
+            if existing is None:
+                to_create.append(OdooContact(odoo_id=odoo_id, **values))
+            elif existing[1] != values['content_hash']:
+                # bulk_update() doesn't apply auto_now, hence the explicit last_synced
+                to_update.append(OdooContact(pk=existing[0], odoo_id=odoo_id, last_synced=now, **values))
+
+        try:
+            # One INSERT for the new rows and one UPDATE ... CASE WHEN per batch of changed rows,
+            # committed together so a failure leaves no half-applied sync behind
+            with transaction.atomic():
+                OdooContact.objects.bulk_create(to_create, batch_size=DB_BATCH_SIZE)
+                OdooContact.objects.bulk_update(to_update, fields=SYNCED_FIELDS, batch_size=DB_BATCH_SIZE)
+                # Everything visible before the snapshot has now been pulled, whatever the fetched rows' own write_dates
+                if snapshot is not None:
+                    cursor_time = datetime.datetime.strptime(snapshot, ODOO_DATETIME_FORMAT) - PARTNER_CURSOR_OVERLAP
+                    SyncCursor.objects.update_or_create(key=PARTNER_CURSOR_KEY, defaults={'value': cursor_time.strftime(ODOO_DATETIME_FORMAT)})
+        except Exception as e:
+            logger.error("Error syncing contacts from Odoo: %s", e)
+            return
+        
+        logger.info("Synchronization complete. %s new contacts created, %s contacts updated.", len(to_create), len(to_update))
+
+    def _fetch_countries(self, url, fetch_params):
+        """
+        Fetch every res.country once as an {id: name} dict, so partners only need to carry the country id.
+        Returns None if the request failed.
+        """
+        country_params = {**fetch_params, 'model': 'res.country', 'domain': [], 'kwargs': {'fields': ['id', 'name']}}
+        countries_response = self._make_odoo_request(url, method="execute_kw", service="object", **country_params)
+        if countries_response is None: # Error handled by _make_odoo_request
+            return None
+        if not isinstance(countries_response, Ok): # Error object
+            logger.error("Failed to fetch countries from Odoo. Error: %s Data: %s", countries_response.message, getattr(countries_response, 'data', None))
+            return None
+        return {country['id']: country['name'] for country in countries_response.result}
 
+    def _fetch_pages(self, url, fetch_params, page_kwargs):
+        """
+        Run one search_read per entry of ``page_kwargs`` concurrently over the shared session.
+        Returns the records of all pages (in no particular order), or None if a page failed.
+        """
         contacts_data = []
-        if contacts_response is None: # Error handled by _make_odoo_request
+        executor = ThreadPoolExecutor(max_workers=ODOO_FETCH_WORKERS)
+        futures = [
+            executor.submit(self._make_odoo_request, url, method="execute_kw", service="object", **fetch_params, kwargs=kwargs)
+            for kwargs in page_kwargs
+        ]
+        try:
+            for future in as_completed(futures):
+                page_response = future.result()
+                if page_response is None or not isinstance(page_response, Ok):
+                    if page_response is not None: # Error object; None was already logged by _make_odoo_request
+                        logger.error("Failed to fetch contacts from Odoo. Error: %s Data: %s", page_response.message, getattr(page_response, 'data', None))
+                    return None
+                contacts_data.extend(page_response.result)
+            return contacts_data
+        finally:
+            # Whether a page failed or raised, drop the pages still queued rather than
+            # downloading all of them before the failure is reported
+            executor.shutdown(cancel_futures=True)
+
+    async def _async_do(self, session=None, semaphore=None):
+        """
+        Same synchronization as _sync, with every Odoo call made through aiohttp so the
+        country lookup and all search_read pages are in flight at the same time.
+
+        When run from odoo_sync.scheduler, ``session`` and ``semaphore`` are shared with the
+        other sync jobs of the process; otherwise a session is opened for this run only.
+        """
+        if not self._load_transport():
             return
-        if isinstance(contacts_response, Ok):
-            contacts_data = contacts_response.result
-            logger.info(f"Successfully fetched {len(contacts_data)} contacts from Odoo.")
-        else: # Error object
-            logger.error(f"Failed to fetch contacts from Odoo. Error: {contacts_response.message} Data: {getattr(contacts_response, 'data', None)}")
+        logger.info("Starting Odoo contacts synchronization cron job.")
+
+        odoo_settings = self._get_odoo_settings()
+        if odoo_settings is None:
+            return
+
+        self.odoo_semaphore = semaphore
+        if session is not None:
+            fetched = await self._a_fetch_contacts(session, *odoo_settings)
+        else:
+            async with self._a_build_session() as session:
+                fetched = await self._a_fetch_contacts(session, *odoo_settings)
+        if fetched is None: # Error handled and logged while fetching
             return
+        await sync_to_async(self._write_contacts)(*fetched)
+
+    @staticmethod
+    def _a_build_session():
+        """
+        Create the aiohttp session used for Odoo calls on the async path.
+        """
+        connector = aiohttp.TCPConnector(limit=ODOO_ASYNC_CONNECTION_LIMIT, ttl_dns_cache=300)
+        # Per-connect/per-read limits like the requests path's timeout=20. A total limit would also count
+        # the time a page spends queued for a free pooled connection, failing later pages of a large sync.
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=20, sock_read=20)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def _a_fetch_contacts(self, session, ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD):
+        """
+        Fetch the partners changed since the last sync and the country lookup over ``session``.
+        Returns (contacts_data, countries, snapshot), or None if any call failed.
+        """
+        url = f"{ODOO_URL}/jsonrpc"
+        auth_params = {
+            "db": ODOO_DB,
+            "login": ODOO_USERNAME,
+            "password": ODOO_PASSWORD
+        }
+        uid = await self._a_authenticate(session, url, auth_params)
+        if not uid: # Error handled and logged by _a_authenticate
+            return None
+
+        # Taken before search_count, as in _sync
+        snapshot, major_version = await self._a_server_info(session, url)
+        if snapshot is None:
+            logger.warning("Could not read Odoo's server time; the sync cursor will not be advanced this run.")
+        domain = await sync_to_async(self._partner_domain)(snapshot)
+
+        object_params = {'db': ODOO_DB, 'password': ODOO_PASSWORD, 'model': 'res.partner', 'domain': domain}
+        count_payload = self._build_odoo_payload("execute_kw", "object", uid=uid, operation='search_count', **object_params)
+        count_response = await self._a_make_odoo_request(session, url, count_payload)
+
+        if self._is_access_denied(count_response):
+            # The cached UID may be stale (user recreated, database restored...); log in again once and retry
+            logger.info("Odoo denied access with the current UID, re-authenticating.")
+            uid = await self._a_authenticate(session, url, auth_params, force=True)
+            if not uid:
+                return None
+            count_payload = self._build_odoo_payload("execute_kw", "object", uid=uid, operation='search_count', **object_params)
+            count_response = await self._a_make_odoo_request(session, url, count_payload)
+
+        if count_response is None: # Error handled by _a_make_odoo_request
+            return None
+        if not isinstance(count_response, Ok): # Error object
+            logger.error("Failed to fetch contacts from Odoo. Error: %s Data: %s", count_response.message, getattr(count_response, 'data', None))
+            return None
+
+        bare_ids = self._sends_bare_ids(major_version)
+        page_kwargs = self._build_page_kwargs(count_response.result, bare_ids)
+        if not page_kwargs:
+            logger.info("Successfully fetched 0 contacts from Odoo.")
+            return [], {}, snapshot
+
+        country_payload = self._build_odoo_payload(
+            "execute_kw", "object", uid=uid, operation='search_read',
+            **{**object_params, 'model': 'res.country', 'domain': [], 'kwargs': {'fields': ['id', 'name']}}
+        )
+        page_payloads = [
+            self._build_odoo_payload("execute_kw", "object", uid=uid, operation='search_read', kwargs=kwargs, **object_params)
+            for kwargs in page_kwargs
+        ]
+        # Without bare ids, partners carry the country name themselves and no lookup is needed
+        country_requests = [self._a_make_odoo_request(session, url, country_payload)] if bare_ids else []
+        page_responses = await asyncio.gather(
+            *country_requests,
+            *[self._a_make_odoo_request(session, url, payload) for payload in page_payloads],
+        )
+
+        countries = {}
+        if bare_ids:
+            countries_response = page_responses.pop(0)
+            if countries_response is None: # Error handled by _a_make_odoo_request
+                return None
+            if not isinstance(countries_response, Ok): # Error object
+                logger.error("Failed to fetch countries from Odoo. Error: %s Data: %s", countries_response.message, getattr(countries_response, 'data', None))
+                return None
+            countries = {country['id']: country['name'] for country in countries_response.result}
+
+        contacts_data = []
+        for page_response in page_responses:
+            if page_response is None: # Error handled by _a_make_odoo_request
+                return None
+            if not isinstance(page_response, Ok): # Error object
+                logger.error("Failed to fetch contacts from Odoo. Error: %s Data: %s", page_response.message, getattr(page_response, 'data', None))
+                return None
+            contacts_data.extend(page_response.result)
+        logger.info("Successfully fetched %s contacts from Odoo.", len(contacts_data))
+        return contacts_data, countries, snapshot
+
+    async def _a_server_info(self, session, url):
+        """
+        Async counterpart of _server_info.
+        """
+        payload = self._build_odoo_payload("version", "common")
+        content_type = ODOO_CONTENT_TYPES[self.transport]
+        try:
+            async with self.odoo_semaphore or contextlib.nullcontext(), \
+                    session.post(url, data=self._encode_payload(payload), headers={'Content-Type': content_type, 'Accept': content_type}) as response:
+                return self._write_date_from_http_date(response.headers.get('Date')), self._major_version(await response.read())
+        except asyncio.TimeoutError:
+            logger.error("Timeout during Odoo request to %s for method %s", url, "version")
+            return None, None
+        except aiohttp.ClientError as e:
+            logger.error("Request exception during Odoo request to %s: %s", url, e)
+            return None, None
+
+    async def _a_authenticate(self, session, auth_url, auth_params, force=False):
+        """
+        Async counterpart of _authenticate, sharing the same UID cache entry.
+        """
+        cache_key = self._uid_cache_key(auth_params)
+        if force:
+            await cache.adelete(cache_key)
+        else:
+            uid = await cache.aget(cache_key)
+            if uid:
+                logger.info("Using cached Odoo UID: %s", uid)
+                return uid
+
+        payload = self._build_odoo_payload("login", "common", **auth_params)
+        uid = self._uid_from_login_response(await self._a_make_odoo_request(session, auth_url, payload))
+        if uid:
+            await cache.aset(cache_key, uid, timeout=ODOO_UID_CACHE_TIMEOUT)
+        return uid
+
+    async def _a_make_odoo_request(self, session, url, payload):
+        """
+        POST a JSON-RPC payload with aiohttp and parse the reply.
+        Returns an Ok/Error object, or None if the request failed (the failure is logged).
+        """
+        method = payload["params"].get("method", payload["method"])
+        try:
+            content_type = ODOO_CONTENT_TYPES[self.transport]
+            # Shared scheduler semaphore caps concurrent Odoo calls across all jobs of the process
+            async with self.odoo_semaphore or contextlib.nullcontext(), \
+                    session.post(url, data=self._encode_payload(payload), headers={'Content-Type': content_type, 'Accept': content_type}) as response:
+                body = await response.read()
+                if response.status >= 400:
+                    response_text_snippet = body[:200].decode(errors='replace') # Limit snippet length
+                    logger.error(
+                        "HTTP error during Odoo request to %s: Status %s %s. Response text snippet: %s",
+                        url, response.status, response.reason, response_text_snippet
+                    )
+                    # Odoo may still have answered with a JSON-RPC error object
+                    if body:
+                        try:
+                            return parse(self._decode_body(body))
+                        except Exception as parse_e:
+                            logger.error("Could not parse error response from Odoo: %s", parse_e)
+                    return None
+                return parse(self._decode_body(body))
+        except asyncio.TimeoutError:
+            logger.error("Timeout during Odoo request to %s for method %s", url, method)
+            return None
+        except aiohttp.ClientError as e:
+            logger.error("Request exception during Odoo request to %s: %s", url, e)
+            return None
+        except Exception as e: # Catch other errors like JSON parsing issues from valid HTTP responses
+            logger.error("Error processing Odoo request or response (%s, %s): %s", url, method, e)
+            return None
 
-        # Data Syncing
-        synced_count = 0
-        updated_count = 0
+    def _build_contact_values(self, contacts_data, countries):
+        """
+        Turn Odoo partner records into OdooContact field values (including
+        content_hash), keyed by Odoo ID so a partner listed twice is only
+        written once. ``countries`` maps res.country ids to names.
+        """
+        contact_values = {}
         for contact_data in contacts_data:
-            country_name = None
-            if contact_data.get('country_id') and isinstance(contact_data['country_id'], list) and len(contact_data['country_id']) > 1:
-                country_name = contact_data['country_id'][1]
-            elif contact_data.get('country_id') is False: # Handle Odoo returning False for empty Many2one
-                 country_name = None
-
-
-            defaults = {
-                'name': contact_data.get('name'),
-                'email': contact_data.get('email'),
-                'phone': contact_data.get('phone'),
-                'street': contact_data.get('street'),
-                'city': contact_data.get('city'),
-                'zip_code': contact_data.get('zip'), # Ensure this matches Odoo field 'zip'
-                'country': country_name,
-            }
-            
-            defaults = {k: v for k, v in defaults.items() if v is not None or k in ['email', 'phone', 'street', 'city', 'zip_code', 'country']} # Allow explicit None for clearing fields
+            # Missing/None values are kept so the write clears the field locally. Odoo sends False for an
+            # empty field, which the nullable columns should store as NULL rather than the string 'False'.
+            defaults = {}
+            for model_key, odoo_key in _FIELD_MAP:
+                value = contact_data.get(odoo_key)
+                defaults[model_key] = None if value is False and model_key in _CLEARABLE_FIELDS else value
+            if defaults['name'] is None or defaults['name'] is False:
+                # name is NOT NULL: a partner sent without one (or with False) is stored with an empty name
+                defaults['name'] = ''
+            # country_id is a bare id, or False/None when empty, which simply misses the lookup.
+            # Servers older than ODOO_LOAD_NONE_MIN_VERSION aren't sent load=None and answer with [id, display_name].
+            country_id = contact_data.get('country_id')
+            defaults['country'] = country_id[1] if type(country_id) is list else countries.get(country_id)
+            defaults['content_hash'] = hashlib.blake2b(repr(tuple(defaults.values())).encode(), digest_size=16).digest()
 
-            try:
-                obj, created = OdooContact.objects.update_or_create(
-                    odoo_id=contact_data['id'],
-                    defaults=defaults
-                )
-                if created:
-                    synced_count += 1
-                else:
-                    updated_count +=1
-            except Exception as e:
-                logger.error(f"Error syncing contact with Odoo ID {contact_data.get('id')}: {e}")
-        
-        logger.info(f"Synchronization complete. {synced_count} new contacts created, {updated_count} contacts updated.")
+            contact_values[contact_data['id']] = defaults
+        return contact_values
+
+    def _invalid_field(self, values):
+        """
+        Describe the first synced value the OdooContact columns can't hold, or return None if the row is valid.
+        """
+        for field_name, (max_length, null) in _TEXT_FIELD_LIMITS.items():
+            value = values[field_name]
+            if value is None:
+                if not null:
+                    return f"{field_name} is required"
+            elif len(str(value)) > max_length:
+                return f"{field_name} is longer than {max_length} characters"
+        return None
+
+    def _existing_rows(self, odoo_ids):
+        """
+        Return {odoo_id: (pk, content_hash)} for the ``odoo_ids`` that already have an OdooContact row.
+        Looked up in chunks to stay under the database's query parameter limit.
+        """
+        existing_rows = {}
+        for start in range(0, len(odoo_ids), DB_BATCH_SIZE):
+            rows = OdooContact.objects.filter(odoo_id__in=odoo_ids[start:start + DB_BATCH_SIZE]).values_list('odoo_id', 'id', 'content_hash')
+            # PostgreSQL hands BinaryField values back as memoryview, which never equals the bytes digest
+            existing_rows.update(
+                (odoo_id, (pk, None if content_hash is None else bytes(content_hash)))
+                for odoo_id, pk, content_hash in rows
+            )
+        return existing_rows
@@ -0,0 +1,13 @@
+import asyncio
+from django.core.management.base import BaseCommand
+from odoo_sync.scheduler import run_scheduler
+
+
+class Command(BaseCommand):
+    help = "Run all Odoo sync jobs concurrently in a single long-running process."
+
+    def handle(self, *args, **options):
+        try:
+            asyncio.run(run_scheduler())
+        except KeyboardInterrupt:
+            self.stdout.write("Odoo sync scheduler stopped.")
@@ -0,0 +1,18 @@
+# Generated by Django 4.1 on 2026-10-15 21:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('odoo_sync', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='odoocontact',
+            name='content_hash',
+            field=models.BinaryField(max_length=16, null=True),
+        ),
+    ]
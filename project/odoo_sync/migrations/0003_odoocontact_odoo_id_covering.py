@@ -0,0 +1,48 @@
+from django.db import migrations
+
+
+def _odoo_id_unique_constraint(schema_editor, model):
+    """
+    Return the name of the unique constraint Django created for OdooContact.odoo_id.
+    """
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    return next(
+        name for name, info in constraints.items()
+        if info['unique'] and not info['primary_key'] and info['columns'] == ['odoo_id']
+    )
+
+
+def _rebuild_odoo_id_unique(apps, schema_editor, include):
+    # INCLUDE is PostgreSQL-only; elsewhere the plain unique index on odoo_id is kept as is
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    model = apps.get_model('odoo_sync', 'OdooContact')
+    table = schema_editor.quote_name(model._meta.db_table)
+    name = schema_editor.quote_name(_odoo_id_unique_constraint(schema_editor, model))
+    # Same constraint name, so Django's later field alterations still find and drop it
+    schema_editor.execute(
+        f"ALTER TABLE {table} DROP CONSTRAINT {name}, "
+        f"ADD CONSTRAINT {name} UNIQUE (\"odoo_id\"){include}"
+    )
+
+
+def add_include(apps, schema_editor):
+    _rebuild_odoo_id_unique(apps, schema_editor, ' INCLUDE ("id", "content_hash")')
+
+
+def remove_include(apps, schema_editor):
+    _rebuild_odoo_id_unique(apps, schema_editor, '')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('odoo_sync', '0002_odoocontact_content_hash'),
+    ]
+
+    operations = [
+        # Covering the unique index itself rather than adding a second index on odoo_id
+        migrations.RunPython(add_include, remove_include),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.1 on 2026-10-15 21:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('odoo_sync', '0003_odoocontact_odoo_id_covering'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True)),
+                ('value', models.CharField(max_length=255)),
+            ],
+        ),
+    ]
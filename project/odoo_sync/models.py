@@ -1,6 +1,8 @@
 from django.db import models
 
 class OdooContact(models.Model):
+    # On PostgreSQL, migration 0003 makes this unique constraint's index INCLUDE (id, content_hash),
+    # so the sync's (odoo_id -> pk, content_hash) preload is an index-only scan without a second index.
     odoo_id = models.IntegerField(unique=True)
     name = models.CharField(max_length=255)
     email = models.EmailField(null=True, blank=True)
@@ -10,6 +12,19 @@ class OdooContact(models.Model):
     zip_code = models.CharField(max_length=20, null=True, blank=True)
     country = models.CharField(max_length=100, null=True, blank=True)
     last_synced = models.DateTimeField(auto_now=True)
+    # blake2b digest of the synced field values, used to skip rewriting rows Odoo hasn't changed
+    content_hash = models.BinaryField(max_length=16, null=True)
 
     def __str__(self):
         return self.name
+
+
+class SyncCursor(models.Model):
+    """
+    Small key/value store for sync progress, e.g. the latest Odoo write_date already pulled.
+    """
+    key = models.CharField(max_length=100, unique=True)
+    value = models.CharField(max_length=255)
+
+    def __str__(self):
+        return f"{self.key}={self.value}"
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from django.utils import timezone
+from odoo_sync.cron import SyncOdooContactsCronJob
+
+logger = logging.getLogger(__name__)
+
+# Sync jobs run by the in-process scheduler. Each one must provide an async
+# _async_do(session=None, semaphore=None) and a RUN_EVERY_MINS interval.
+ODOO_SYNC_JOBS = (SyncOdooContactsCronJob,)
+
+# Maximum number of Odoo requests in flight at once, across all scheduled jobs.
+ODOO_SCHEDULER_CONCURRENCY = 8
+
+
+async def _run_job(cron_job, session, semaphore):
+    """
+    Run one sync job on the shared session, making sure it doesn't reuse a
+    database connection that went stale while the scheduler was idle.
+    """
+    await sync_to_async(close_old_connections)()
+    try:
+        await cron_job._async_do(session=session, semaphore=semaphore)
+    except Exception:
+        logger.exception("Odoo sync job %s failed.", cron_job.code)
+
+
+def build_scheduler(session, semaphore):
+    """
+    Return an AsyncIOScheduler with every ODOO_SYNC_JOBS entry registered on it.
+    Each job runs once as soon as the scheduler starts, then every RUN_EVERY_MINS.
+    """
+    scheduler = AsyncIOScheduler()
+    for job_class in ODOO_SYNC_JOBS:
+        cron_job = job_class()
+        scheduler.add_job(
+            _run_job, 'interval', minutes=job_class.RUN_EVERY_MINS,
+            args=(cron_job, session, semaphore), id=cron_job.code,
+            next_run_time=timezone.now(), max_instances=1, coalesce=True,
+        )
+    return scheduler
+
+
+async def run_scheduler():
+    """
+    Run all Odoo sync jobs in this process until cancelled, sharing one aiohttp
+    session (and its connection pool) and one concurrency cap between them.
+    """
+    semaphore = asyncio.Semaphore(ODOO_SCHEDULER_CONCURRENCY)
+    async with SyncOdooContactsCronJob._a_build_session() as session:
+        scheduler = build_scheduler(session, semaphore)
+        scheduler.start()
+        logger.info("Odoo sync scheduler started with %s job(s).", len(ODOO_SYNC_JOBS))
+        try:
+            await asyncio.Event().wait() # Jobs run on this loop until the process is stopped
+        finally:
+            scheduler.shutdown(wait=False)
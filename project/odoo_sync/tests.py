@@ -1,18 +1,48 @@
+import asyncio
 import logging
+import operator
 import json # For dumping dicts to JSON strings
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.conf import settings
+from django.core.cache import cache
 from unittest.mock import patch, MagicMock
+from asgiref.sync import async_to_sync
+import msgpack
+import orjson
 import requests # For creating mock HTTP responses
 # Ok and Error are not directly used for mock response construction anymore, but kept for conceptual clarity
 from jsonrpcclient import Ok, Error 
 
-from odoo_sync.models import OdooContact
+from odoo_sync.models import OdooContact, SyncCursor
 from odoo_sync.cron import SyncOdooContactsCronJob
+from odoo_sync.scheduler import ODOO_SCHEDULER_CONCURRENCY, build_scheduler
 
 # Suppress most logging output during tests to keep test output clean
 logging.disable(logging.CRITICAL)
 
+# common.version result of the Odoo server the tests talk to, unless a test says otherwise
+ODOO_VERSION_RESULT = {'server_version': '17.0', 'server_version_info': [17, 0, 0, 'final', 0, '']}
+
+
+class FakeAiohttpResponse:
+    """Stands in for the aiohttp response context manager returned by ClientSession.post()."""
+
+    def __init__(self, status, result_data=None, reason="OK", body=None, headers=None):
+        self.status = status
+        self.reason = reason
+        self.headers = headers if headers is not None else {'Date': 'Mon, 02 Jun 2025 10:00:00 GMT'}
+        self.body = body if body is not None else json.dumps({"jsonrpc": "2.0", "id": 1, "result": result_data}).encode()
+
+    async def read(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
 class TestSyncOdooContactsCronJobRefactored(TestCase):
 
     def setUp(self):
@@ -28,6 +58,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         settings.ODOO_DB = 'fake_db'
         settings.ODOO_USERNAME = 'fake_user'
         settings.ODOO_PASSWORD = 'fake_password'
+        cache.clear() # Don't let a UID cached by a previous test skip the login call
 
     def tearDown(self):
         # Restore original settings
@@ -41,6 +72,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         mock_resp = MagicMock(spec=requests.Response)
         mock_resp.status_code = status_code
         mock_resp.url = f"{settings.ODOO_URL}/jsonrpc" # Ensure response has a URL
+        mock_resp.headers = {}
 
         if text_data_override is not None:
             mock_resp.text = text_data_override
@@ -54,6 +86,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
                 "error": {"code": error_code, "message": error_message, "data": error_data_detail}
             }
             mock_resp.text = json.dumps(response_dict)
+        mock_resp.content = mock_resp.text.encode()
 
         # Set reason based on status code for HTTPError __str__
         if status_code == 500: mock_resp.reason = "Server Error"
@@ -76,7 +109,28 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
             
         return mock_resp
 
-    @patch('odoo_sync.cron.requests.post')
+    def _logged_messages(self, mock_log_method):
+        """Render the (format, *args) calls made on a mocked logger method into their final messages."""
+        return [
+            call_args.args[0] % call_args.args[1:] if len(call_args.args) > 1 else call_args.args[0]
+            for call_args in mock_log_method.call_args_list
+        ]
+
+    def _server_time_response(self, http_date='Mon, 02 Jun 2025 10:00:00 GMT', version_result=ODOO_VERSION_RESULT):
+        """Answer to the common.version call whose Date header gives the sync snapshot."""
+        mock_resp = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=version_result)
+        mock_resp.headers = {'Date': http_date}
+        return mock_resp
+
+    def _count_response(self, count):
+        return self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=count)
+
+    def _countries_response(self, countries=None):
+        if countries is None:
+            countries = [{'id': 10, 'name': 'Testland'}, {'id': 20, 'name': 'Specific Country'}]
+        return self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=countries)
+
+    @patch('odoo_sync.cron.requests.Session.post')
     def test_successful_sync_new_contact(self, mock_post):
         auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
         contact_list = [{
@@ -86,7 +140,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         }]
         search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
         
-        mock_post.side_effect = [auth_response, search_read_response]
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(len(contact_list)), self._countries_response(), search_read_response]
         
         self.cron_job.do()
 
@@ -96,7 +150,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         self.assertEqual(contact.name, 'Test Contact 1')
         self.assertEqual(contact.country, 'Testland')
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     def test_successful_sync_update_existing_contact(self, mock_post):
         OdooContact.objects.create(odoo_id=2, name='Original Name', email='original@example.com')
         
@@ -106,7 +160,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         }]
         search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=updated_contact_data)
         
-        mock_post.side_effect = [auth_response, search_read_response]
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(len(updated_contact_data)), self._countries_response(), search_read_response]
 
         self.cron_job.do()
 
@@ -116,7 +170,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         self.assertEqual(contact.email, 'updated@example.com')
         self.assertEqual(contact.phone, '9876543210')
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     @patch('odoo_sync.cron.logger')
     def test_odoo_authentication_failure_jsonrpc_error(self, mock_logger, mock_post):
         auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=False, error_message="Invalid credentials", error_data_detail={"debug": "traceback..."})
@@ -125,9 +179,9 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         self.cron_job.do()
 
         self.assertEqual(OdooContact.objects.count(), 0)
-        mock_logger.error.assert_any_call("Odoo authentication failed. Error: Invalid credentials Data: {'debug': 'traceback...'}")
+        self.assertIn("Odoo authentication failed. Error: Invalid credentials Data: {'debug': 'traceback...'}", self._logged_messages(mock_logger.error))
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     @patch('odoo_sync.cron.logger')
     def test_odoo_authentication_failure_http_error(self, mock_logger, mock_post):
         response_text = "Internal Server Error text from Odoo"
@@ -142,10 +196,10 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
             f"HTTP error during Odoo request to {settings.ODOO_URL}/jsonrpc: "
             f"Status 500 Server Error. Response text snippet: {response_text}"
         )
-        mock_logger.error.assert_any_call(expected_log_message)
+        self.assertIn(expected_log_message, self._logged_messages(mock_logger.error))
 
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     @patch('odoo_sync.cron.logger')
     def test_odoo_authentication_failure_network_error(self, mock_logger, mock_post):
         mock_post.side_effect = requests.exceptions.ConnectionError("Failed to connect")
@@ -153,28 +207,28 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         self.cron_job.do()
 
         self.assertEqual(OdooContact.objects.count(), 0)
-        mock_logger.error.assert_any_call(f"Request exception during Odoo request to {settings.ODOO_URL}/jsonrpc: Failed to connect")
+        self.assertIn(f"Request exception during Odoo request to {settings.ODOO_URL}/jsonrpc: Failed to connect", self._logged_messages(mock_logger.error))
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     @patch('odoo_sync.cron.logger')
     def test_odoo_search_read_failure_jsonrpc_error(self, mock_logger, mock_post):
         auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
         search_read_error_response = self._prepare_mock_response(200, is_jsonrpc_ok=False, error_message="Access Denied", error_data_detail={"type": "security_error"})
         
-        mock_post.side_effect = [auth_response, search_read_error_response]
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(1), self._countries_response(), search_read_error_response]
 
         self.cron_job.do()
 
         self.assertEqual(OdooContact.objects.count(), 0)
-        mock_logger.error.assert_any_call("Failed to fetch contacts from Odoo. Error: Access Denied Data: {'type': 'security_error'}")
+        self.assertIn("Failed to fetch contacts from Odoo. Error: Access Denied Data: {'type': 'security_error'}", self._logged_messages(mock_logger.error))
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     @patch('odoo_sync.cron.logger')
     def test_odoo_search_read_failure_http_error(self, mock_logger, mock_post):
         auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
         response_text = "Service Unavailable text from Odoo"
         search_read_http_error_response = self._prepare_mock_response(503, text_data_override=response_text)
-        mock_post.side_effect = [auth_response, search_read_http_error_response]
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(1), self._countries_response(), search_read_http_error_response]
 
         self.cron_job.do()
         self.assertEqual(OdooContact.objects.count(), 0)
@@ -182,20 +236,20 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
             f"HTTP error during Odoo request to {settings.ODOO_URL}/jsonrpc: "
             f"Status 503 Service Unavailable. Response text snippet: {response_text}"
         )
-        mock_logger.error.assert_any_call(expected_log_message)
+        self.assertIn(expected_log_message, self._logged_messages(mock_logger.error))
 
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     def test_data_mapping_country_id_format_and_false(self, mock_post):
         auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
         contacts_data = [
-            {'id': 3, 'name': 'Contact with Country', 'country_id': [20, 'Specific Country']},
+            {'id': 3, 'name': 'Contact with Country', 'country_id': 20}, # Bare id, as sent for load=None
             {'id': 4, 'name': 'Contact No Country', 'country_id': False}, 
             {'id': 5, 'name': 'Contact Null Country', 'country_id': None} 
         ]
         search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contacts_data)
         
-        mock_post.side_effect = [auth_response, search_read_response]
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(len(contacts_data)), self._countries_response(), search_read_response]
         self.cron_job.do()
 
         self.assertEqual(OdooContact.objects.count(), 3)
@@ -208,13 +262,12 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         contact_5 = OdooContact.objects.get(odoo_id=5)
         self.assertIsNone(contact_5.country)
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     @patch('odoo_sync.cron.logger')
     def test_empty_search_read_result(self, mock_logger, mock_post):
         auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
-        search_read_empty_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=[])
-        
-        mock_post.side_effect = [auth_response, search_read_empty_response]
+        # Nothing to page through, so no search_read request is made
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(0)]
         
         OdooContact.objects.create(odoo_id=99, name="PreExisting")
 
@@ -222,8 +275,8 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
 
         self.assertEqual(OdooContact.objects.count(), 1) 
         self.assertTrue(OdooContact.objects.filter(odoo_id=99).exists())
-        mock_logger.info.assert_any_call("Successfully fetched 0 contacts from Odoo.")
-        mock_logger.info.assert_any_call("Synchronization complete. 0 new contacts created, 0 contacts updated.")
+        self.assertIn("Successfully fetched 0 contacts from Odoo.", self._logged_messages(mock_logger.info))
+        self.assertIn("Synchronization complete. 0 new contacts created, 0 contacts updated.", self._logged_messages(mock_logger.info))
 
     @patch('odoo_sync.cron.logger')
     def test_settings_not_configured(self, mock_logger):
@@ -237,7 +290,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         
         settings.ODOO_URL = original_url
     
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     def test_successful_sync_contact_clears_fields_with_none(self, mock_post):
         OdooContact.objects.create(
             odoo_id=7, name='Contact Seven', email='seven@example.com', phone='7777777'
@@ -249,7 +302,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         }]
         search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=updated_contact_data)
         
-        mock_post.side_effect = [auth_response, search_read_response]
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(len(updated_contact_data)), self._countries_response(), search_read_response]
 
         self.cron_job.do()
 
@@ -259,7 +312,7 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         self.assertIsNone(contact.email, "Email should have been cleared to None")
         self.assertEqual(contact.phone, '777-NEW')
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     @patch('odoo_sync.cron.logger')
     def test_odoo_login_returns_false_uid(self, mock_logger, mock_post):
         auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=False)
@@ -268,30 +321,640 @@ class TestSyncOdooContactsCronJobRefactored(TestCase):
         self.cron_job.do()
 
         self.assertEqual(OdooContact.objects.count(), 0)
-        mock_logger.error.assert_any_call("Odoo authentication failed. Odoo responded with 'False' for UID. Full response result: False")
+        self.assertIn("Odoo authentication failed. Odoo responded with 'False' for UID. Full response result: False", self._logged_messages(mock_logger.error))
 
 
-    @patch('odoo_sync.cron.requests.post')
+    @patch('odoo_sync.cron.requests.Session.post')
     @patch('odoo_sync.cron.logger')
     def test_malformed_json_response_from_odoo(self, mock_logger, mock_post):
         auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
         response_text = "This is not JSON {"
         malformed_response = self._prepare_mock_response(200, text_data_override=response_text)
         
-        mock_post.side_effect = [auth_response, malformed_response]
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(1), self._countries_response(), malformed_response]
 
         self.cron_job.do()
 
         self.assertEqual(OdooContact.objects.count(), 0)
         
         # Check that *one* of the error calls contains the expected message
-        # The first error will be about processing, the second (if http error also leads to parse attempt) about parsing the error response.
-        # Here, the HTTP call is 200, so only the "Error processing" log should appear from _make_odoo_request's main try-except.
+        # Bodies are decoded with orjson, whose JSONDecodeError words the failure differently from json's
         found_log = False
-        for call_args in mock_logger.error.call_args_list:
-            logged_message = str(call_args[0][0])
+        for logged_message in self._logged_messages(mock_logger.error):
             if "Error processing Odoo request or response" in logged_message and \
-               ("Expecting value: line 1 column 1 (char 0)" in logged_message): # Specific to json.JSONDecodeError
+               ("unexpected character: line 1 column 1 (char 0)" in logged_message):
                 found_log = True
                 break
         self.assertTrue(found_log, f"Expected log message for malformed JSON not found. Logs: {mock_logger.error.call_args_list}")
+
+    @patch('odoo_sync.cron.requests.Session.close')
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_requests_share_pooled_session_and_close_it(self, mock_post, mock_close):
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(0)]
+
+        self.cron_job.do()
+
+        self.assertEqual(mock_post.call_count, 3)
+        mock_close.assert_called_once()
+        self.assertIsNone(self.cron_job.session)
+
+    def test_session_mounts_retrying_adapter(self):
+        session = self.cron_job._build_session()
+        try:
+            adapter = session.get_adapter('https://fake-odoo-url.com/jsonrpc')
+            self.assertEqual(adapter.max_retries.total, 3)
+            self.assertIn(503, adapter.max_retries.status_forcelist)
+            self.assertEqual(session.headers['Content-Type'], 'application/json')
+        finally:
+            session.close()
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_cached_uid_skips_login(self, mock_post):
+        cache.set("odoo_uid:fake_db:fake_user", 123)
+        contact_list = [{'id': 8, 'name': 'Cached Login Contact'}]
+        mock_post.side_effect = [self._server_time_response(), self._count_response(len(contact_list)), self._countries_response(), self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)]
+
+        self.cron_job.do()
+
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(orjson.loads(mock_post.call_args.kwargs['data'])['params']['args'][1], 123)
+        self.assertTrue(OdooContact.objects.filter(odoo_id=8).exists())
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_successful_login_caches_uid(self, mock_post):
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(0)]
+
+        self.cron_job.do()
+
+        self.assertEqual(cache.get("odoo_uid:fake_db:fake_user"), 123)
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_stale_cached_uid_triggers_single_relogin(self, mock_post):
+        cache.set("odoo_uid:fake_db:fake_user", 999)
+        access_denied_response = self._prepare_mock_response(
+            200, is_jsonrpc_ok=False, error_code=200, error_message="Odoo Server Error",
+            error_data_detail={"name": "odoo.exceptions.AccessDenied", "message": "Access Denied"}
+        )
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        contact_list = [{'id': 9, 'name': 'Relogin Contact'}]
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
+        mock_post.side_effect = [self._server_time_response(), access_denied_response, auth_response, self._count_response(len(contact_list)), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        self.assertEqual(mock_post.call_count, 6)
+        self.assertEqual(cache.get("odoo_uid:fake_db:fake_user"), 123)
+        self.assertTrue(OdooContact.objects.filter(odoo_id=9).exists())
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    @patch('odoo_sync.cron.logger')
+    def test_sync_counts_created_and_updated_contacts(self, mock_logger, mock_post):
+        OdooContact.objects.create(odoo_id=10, name='Existing Ten')
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        contact_list = [
+            {'id': 10, 'name': 'Existing Ten Updated', 'country_id': False},
+            {'id': 11, 'name': 'New Eleven', 'country_id': [10, 'Testland']},
+            {'id': 12, 'name': 'New Twelve', 'country_id': False},
+        ]
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(len(contact_list)), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        self.assertEqual(OdooContact.objects.count(), 3)
+        self.assertEqual(OdooContact.objects.get(odoo_id=10).name, 'Existing Ten Updated')
+        self.assertEqual(OdooContact.objects.get(odoo_id=11).country, 'Testland')
+        self.assertIn("Synchronization complete. 2 new contacts created, 1 contacts updated.", self._logged_messages(mock_logger.info))
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_search_read_is_buffered(self, mock_post):
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        contact_list = [
+            {'id': 13, 'name': 'Buffered Thirteen', 'country_id': [10, 'Testland']},
+            {'id': 14, 'name': 'Buffered Fourteen', 'country_id': False},
+            {'id': 15, 'name': 'Buffered Fifteen', 'country_id': 20},
+        ]
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(len(contact_list)), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        # One page is a few hundred rows, so it is read in one go and decoded by orjson (see _post_odoo)
+        self.assertFalse(any(call_args.kwargs.get('stream') for call_args in mock_post.call_args_list))
+        self.assertEqual(OdooContact.objects.get(odoo_id=13).country, 'Testland')
+        self.assertTrue(OdooContact.objects.filter(odoo_id=14).exists())
+        self.assertEqual(OdooContact.objects.get(odoo_id=15).country, 'Specific Country')
+
+    @patch('odoo_sync.cron.orjson.loads', wraps=orjson.loads)
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_search_read_pages_are_decoded_with_orjson(self, mock_post, mock_loads):
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=[{'id': 16, 'name': 'Decoded Sixteen'}])
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(1), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        mock_loads.assert_any_call(search_read_response.content)
+        self.assertTrue(OdooContact.objects.filter(odoo_id=16).exists())
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    @patch('odoo_sync.cron.logger')
+    def test_truncated_response_writes_nothing(self, mock_logger, mock_post):
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        truncated_response = self._prepare_mock_response(
+            200, text_data_override='{"jsonrpc": "2.0", "id": 1, "result": [{"id": 15, "name": "Complete"}, {"id": 16, "na'
+        )
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(2), self._countries_response(), truncated_response]
+
+        self.cron_job.do()
+
+        self.assertEqual(OdooContact.objects.count(), 0)
+        self.assertTrue(any(
+            "Error processing Odoo request or response" in logged_message
+            for logged_message in self._logged_messages(mock_logger.error)
+        ))
+
+    @patch('odoo_sync.cron.ODOO_FETCH_WORKERS', 1)
+    @patch('odoo_sync.cron.ODOO_PAGE_SIZE', 1)
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_truncated_page_cancels_queued_pages(self, mock_post):
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+
+        def respond(url, data, **kwargs):
+            args = orjson.loads(data)['params'].get('args')
+            if args is None: # login
+                return auth_response
+            if not args: # common.version
+                return self._server_time_response()
+            if args[3] == 'res.partner' and args[4] == 'search_read':
+                if args[6]['offset'] == 0:
+                    return self._prepare_mock_response(200, text_data_override='{"jsonrpc": "2.0", "id": 1, "result": [{"id": 1')
+                return self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=[{'id': args[6]['offset'] + 1, 'name': 'Queued'}])
+            return {'search_count': self._count_response(5), 'search_read': self._countries_response()}[args[4]]
+        mock_post.side_effect = respond
+
+        self.cron_job.do()
+
+        self.assertEqual(OdooContact.objects.count(), 0)
+        self.assertGreaterEqual(mock_post.call_count, 5) # The sync got as far as the first page
+        # login, server time, search_count, res.country, the truncated page and at most the page the worker had already started
+        self.assertLessEqual(mock_post.call_count, 6)
+
+    @patch('odoo_sync.cron.ODOO_PAGE_SIZE', 2)
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_search_read_is_paginated(self, mock_post):
+        pages = {
+            0: [{'id': 20, 'name': 'Page One A'}, {'id': 21, 'name': 'Page One B'}],
+            2: [{'id': 22, 'name': 'Page Two A'}, {'id': 23, 'name': 'Page Two B'}],
+            4: [{'id': 24, 'name': 'Page Three A'}],
+        }
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+
+        def respond(url, data, **kwargs):
+            params = orjson.loads(data)['params']
+            if params.get('method') == 'version':
+                return self._server_time_response()
+            if params.get('method') != 'execute_kw':
+                return auth_response
+            model, operation, _, page_kwargs = params['args'][3:7]
+            if operation == 'search_count':
+                return self._count_response(5)
+            if model == 'res.country':
+                return self._countries_response()
+            self.assertEqual(page_kwargs['limit'], 2)
+            self.assertEqual(page_kwargs['order'], 'id')
+            return self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=pages[page_kwargs['offset']])
+
+        mock_post.side_effect = respond
+
+        self.cron_job.do()
+
+        self.assertEqual(mock_post.call_count, 7) # login, server time, search_count, res.country and three pages
+        self.assertEqual(
+            sorted(OdooContact.objects.values_list('odoo_id', flat=True)),
+            [20, 21, 22, 23, 24]
+        )
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_partner_fetch_requests_bare_country_ids(self, mock_post):
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=[])
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(1), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        country_args = orjson.loads(mock_post.call_args_list[3].kwargs['data'])['params']['args']
+        self.assertEqual(country_args[3], 'res.country')
+        self.assertEqual(country_args[6], {'fields': ['id', 'name']})
+        partner_kwargs = orjson.loads(mock_post.call_args_list[4].kwargs['data'])['params']['args'][6]
+        self.assertIsNone(partner_kwargs['load'])
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_pre_15_server_gets_no_load_and_no_country_lookup(self, mock_post):
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        odoo_14_version = {'server_version': '14.0', 'server_version_info': [14, 0, 0, 'final', 0, '']}
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=[
+            {'id': 17, 'name': 'Fourteen', 'country_id': [10, 'Testland']},
+        ])
+        mock_post.side_effect = [auth_response, self._server_time_response(version_result=odoo_14_version), self._count_response(1), search_read_response]
+
+        self.cron_job.do()
+
+        # search_read only takes **read_kwargs (load) from Odoo 15 on; res.country isn't read either
+        partner_kwargs = orjson.loads(mock_post.call_args_list[3].kwargs['data'])['params']['args'][6]
+        self.assertNotIn('load', partner_kwargs)
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(OdooContact.objects.get(odoo_id=17).country, 'Testland')
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    @patch('odoo_sync.cron.logger')
+    def test_unchanged_contacts_are_not_rewritten(self, mock_logger, mock_post):
+        contact_list = [
+            {'id': 30, 'name': 'Static Thirty', 'email': 'thirty@example.com', 'country_id': 10},
+            {'id': 31, 'name': 'Changing Thirty-One', 'country_id': False},
+        ]
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        mock_post.side_effect = [
+            auth_response, self._server_time_response(), self._count_response(2), self._countries_response(),
+            self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list),
+        ]
+        self.cron_job.do()
+        self.assertIsNotNone(OdooContact.objects.get(odoo_id=30).content_hash)
+
+        # Edit the local row behind the sync's back: an unchanged Odoo record must not overwrite it
+        OdooContact.objects.filter(odoo_id=30).update(name='Locally Edited')
+        contact_list[1] = {'id': 31, 'name': 'Changed Thirty-One', 'country_id': False}
+        mock_post.side_effect = [
+            self._server_time_response(), self._count_response(2), self._countries_response(),
+            self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list),
+        ]
+        self.cron_job.do()
+
+        self.assertEqual(OdooContact.objects.get(odoo_id=30).name, 'Locally Edited')
+        self.assertEqual(OdooContact.objects.get(odoo_id=31).name, 'Changed Thirty-One')
+        self.assertIn("Synchronization complete. 0 new contacts created, 1 contacts updated.", self._logged_messages(mock_logger.info))
+
+    def _fake_odoo_server(self, contacts_by_offset, count, page_status=200):
+        """Build a ClientSession.post replacement answering login, search_count, res.country and partner pages."""
+        def post(url, data, **kwargs):
+            params = orjson.loads(data)['params']
+            if params.get('method') == 'version':
+                return FakeAiohttpResponse(200, result_data=ODOO_VERSION_RESULT)
+            if params.get('method') != 'execute_kw':
+                return FakeAiohttpResponse(200, result_data=123)
+            model, operation, _, page_kwargs = params['args'][3:7]
+            if operation == 'search_count':
+                return FakeAiohttpResponse(200, result_data=count)
+            if model == 'res.country':
+                return FakeAiohttpResponse(200, result_data=[{'id': 10, 'name': 'Testland'}])
+            if page_status != 200:
+                return FakeAiohttpResponse(page_status, reason="Service Unavailable", body=b"Service Unavailable text from Odoo")
+            return FakeAiohttpResponse(200, result_data=contacts_by_offset[page_kwargs['offset']])
+        return post
+
+    @override_settings(ODOO_ASYNC=True)
+    @patch('odoo_sync.cron.ODOO_PAGE_SIZE', 2)
+    @patch('odoo_sync.cron.aiohttp.ClientSession.post')
+    def test_async_sync_fetches_pages_concurrently(self, mock_post):
+        OdooContact.objects.create(odoo_id=40, name='Async Forty Old')
+        contacts_by_offset = {
+            0: [{'id': 40, 'name': 'Async Forty', 'country_id': 10}, {'id': 41, 'name': 'Async Forty-One', 'country_id': False}],
+            2: [{'id': 42, 'name': 'Async Forty-Two', 'country_id': 10}],
+        }
+        mock_post.side_effect = self._fake_odoo_server(contacts_by_offset, count=3)
+
+        self.cron_job.do()
+
+        self.assertEqual(mock_post.call_count, 6) # login, server time, search_count, res.country and two pages
+        self.assertEqual(OdooContact.objects.count(), 3)
+        self.assertEqual(OdooContact.objects.get(odoo_id=40).name, 'Async Forty')
+        self.assertEqual(OdooContact.objects.get(odoo_id=42).country, 'Testland')
+        self.assertEqual(cache.get("odoo_uid:fake_db:fake_user"), 123)
+
+    @override_settings(ODOO_ASYNC=True)
+    @patch('odoo_sync.cron.aiohttp.ClientSession.post')
+    @patch('odoo_sync.cron.logger')
+    def test_async_sync_page_http_error_writes_nothing(self, mock_logger, mock_post):
+        mock_post.side_effect = self._fake_odoo_server({}, count=1, page_status=503)
+
+        self.cron_job.do()
+
+        self.assertEqual(OdooContact.objects.count(), 0)
+        self.assertIn(
+            f"HTTP error during Odoo request to {settings.ODOO_URL}/jsonrpc: "
+            "Status 503 Service Unavailable. Response text snippet: Service Unavailable text from Odoo",
+            self._logged_messages(mock_logger.error)
+        )
+
+    def test_async_session_times_out_per_read_not_per_request(self):
+        async def session_timeout():
+            async with SyncOdooContactsCronJob._a_build_session() as session:
+                return session.timeout
+
+        timeout = async_to_sync(session_timeout)()
+
+        # Time spent waiting for a pooled connection must not count against a page's timeout
+        self.assertIsNone(timeout.total)
+        self.assertEqual(timeout.sock_read, 20)
+        self.assertEqual(timeout.sock_connect, 20)
+
+    def test_payload_ids_are_unique_per_job(self):
+        login_payload = self.cron_job._build_odoo_payload("login", "common", db='fake_db', login='fake_user', password='fake_password')
+        count_payload = self.cron_job._build_odoo_payload("execute_kw", "object", model='res.partner', operation='search_count')
+
+        self.assertEqual(login_payload, {
+            "jsonrpc": "2.0", "method": "login",
+            "params": {'db': 'fake_db', 'login': 'fake_user', 'password': 'fake_password'},
+            "id": login_payload["id"],
+        })
+        self.assertEqual(count_payload["params"]["args"], [None, None, None, 'res.partner', 'search_count', [], {}])
+        self.assertNotEqual(login_payload["id"], count_payload["id"])
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    @patch('odoo_sync.cron.logger')
+    def test_jsonrpc_error_body_on_http_error_is_parsed(self, mock_logger, mock_post):
+        auth_response = self._prepare_mock_response(500, is_jsonrpc_ok=False, error_message="Odoo Server Error", error_data_detail={"name": "builtins.ValueError"})
+        mock_post.return_value = auth_response
+
+        self.cron_job.do()
+
+        self.assertEqual(OdooContact.objects.count(), 0)
+        self.assertIn("Odoo authentication failed. Error: Odoo Server Error Data: {'name': 'builtins.ValueError'}", self._logged_messages(mock_logger.error))
+
+    @patch('odoo_sync.cron.OdooContact.objects.bulk_update', side_effect=Exception("update failed"))
+    @patch('odoo_sync.cron.requests.Session.post')
+    @patch('odoo_sync.cron.logger')
+    def test_failed_write_rolls_back_whole_sync(self, mock_logger, mock_post, mock_bulk_update):
+        OdooContact.objects.create(odoo_id=50, name='Existing Fifty')
+        contact_list = [
+            {'id': 50, 'name': 'Changed Fifty'},
+            {'id': 51, 'name': 'New Fifty-One'},
+        ]
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(len(contact_list)), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        # The INSERT of the new contact is rolled back together with the failed UPDATE
+        self.assertFalse(OdooContact.objects.filter(odoo_id=51).exists())
+        self.assertIn("Error syncing contacts from Odoo: update failed", self._logged_messages(mock_logger.error))
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_incremental_pull_uses_stored_write_date(self, mock_post):
+        contact_list = [{'id': 60, 'name': 'Sixty'}, {'id': 61, 'name': 'Sixty-One'}]
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
+        mock_post.side_effect = [
+            auth_response, self._server_time_response('Sat, 24 May 2025 05:00:00 GMT'),
+            self._count_response(len(contact_list)), self._countries_response(), search_read_response,
+        ]
+
+        self.cron_job.do()
+
+        first_count_args = orjson.loads(mock_post.call_args_list[2].kwargs['data'])['params']['args']
+        # No cursor yet: full pull, up to the server time read before counting
+        self.assertEqual(first_count_args[5], ['|', ['write_date', '=', False], ['write_date', '<', '2025-05-24 05:00:00']])
+        # The cursor is stored PARTNER_CURSOR_OVERLAP before the snapshot
+        self.assertEqual(SyncCursor.objects.get(key='res.partner.write_date').value, '2025-05-24 04:50:00')
+
+        mock_post.reset_mock()
+        mock_post.side_effect = [self._server_time_response('Sun, 25 May 2025 07:30:00 GMT'), self._count_response(0)]
+
+        self.cron_job.do()
+
+        second_count_args = orjson.loads(mock_post.call_args_list[1].kwargs['data'])['params']['args']
+        self.assertEqual(second_count_args[5], [['write_date', '>=', '2025-05-24 04:50:00'], ['write_date', '<', '2025-05-25 07:30:00']])
+        self.assertEqual(SyncCursor.objects.get(key='res.partner.write_date').value, '2025-05-25 07:20:00')
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    @patch('odoo_sync.cron.logger')
+    def test_missing_server_time_keeps_cursor(self, mock_logger, mock_post):
+        SyncCursor.objects.create(key='res.partner.write_date', value='2025-05-24 05:00:00')
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=[{'id': 62, 'name': 'Sixty-Two'}])
+        no_date_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=ODOO_VERSION_RESULT)
+        mock_post.side_effect = [auth_response, no_date_response, self._count_response(1), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        count_args = orjson.loads(mock_post.call_args_list[2].kwargs['data'])['params']['args']
+        self.assertEqual(count_args[5], [['write_date', '>=', '2025-05-24 05:00:00']])
+        self.assertTrue(OdooContact.objects.filter(odoo_id=62).exists())
+        self.assertEqual(SyncCursor.objects.get(key='res.partner.write_date').value, '2025-05-24 05:00:00')
+        self.assertIn("Could not read Odoo's server time; the sync cursor will not be advanced this run.", self._logged_messages(mock_logger.warning))
+
+    @patch('odoo_sync.cron.ODOO_PAGE_SIZE', 1)
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_partner_edited_between_count_and_read_is_not_lost(self, mock_post):
+        SyncCursor.objects.create(key='res.partner.write_date', value='2025-06-01 00:00:00')
+        write_dates = {
+            1: '2025-05-01 00:00:00', # Unchanged since the last sync, until it's edited right after search_count
+            2: '2025-06-01 09:00:00',
+            3: '2025-06-01 09:00:00',
+            4: '2025-06-01 09:00:00',
+        }
+        server_dates = iter(['Sun, 01 Jun 2025 10:00:00 GMT', 'Sun, 01 Jun 2025 10:10:00 GMT'])
+        operators = {'>=': operator.ge, '<': operator.lt}
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+
+        def respond(url, data, **kwargs):
+            """Answer like Odoo would, evaluating the domain against write_dates as they are at that moment."""
+            params = orjson.loads(data)['params']
+            if params.get('method') == 'version':
+                return self._server_time_response(next(server_dates))
+            if params.get('method') != 'execute_kw':
+                return auth_response
+            model, operation, domain, page_kwargs = params['args'][3:7]
+            if model == 'res.country':
+                return self._countries_response()
+            matching = sorted(
+                partner_id for partner_id, write_date in write_dates.items()
+                if all(operators[op](write_date, value) for _, op, value in domain)
+            )
+            if operation == 'search_count':
+                if write_dates[1] < '2025-06-01 10:00:00':
+                    write_dates[1] = '2025-06-01 10:00:02' # Now matches the cursor and sorts first by id
+                return self._count_response(len(matching))
+            page = matching[page_kwargs['offset']:page_kwargs['offset'] + page_kwargs['limit']]
+            return self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=[{'id': partner_id, 'name': f'Partner {partner_id}'} for partner_id in page])
+
+        mock_post.side_effect = respond
+
+        self.cron_job.do()
+
+        # The partner edited mid-run doesn't shift partner 4 past the three counted pages
+        self.assertEqual(sorted(OdooContact.objects.values_list('odoo_id', flat=True)), [2, 3, 4])
+        self.assertEqual(SyncCursor.objects.get(key='res.partner.write_date').value, '2025-06-01 09:50:00')
+
+        self.cron_job.do()
+
+        # ...and the next run picks the edited partner up
+        self.assertEqual(sorted(OdooContact.objects.values_list('odoo_id', flat=True)), [1, 2, 3, 4])
+        self.assertEqual(SyncCursor.objects.get(key='res.partner.write_date').value, '2025-06-01 10:00:00')
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_partner_committed_after_the_snapshot_is_not_lost(self, mock_post):
+        # Partner 2 is written by a transaction that started before the first run's snapshot but
+        # only commits after it, so it shows up with a write_date just under that snapshot.
+        write_dates = {1: '2025-06-01 09:00:00'}
+        server_dates = iter(['Sun, 01 Jun 2025 10:00:00 GMT', 'Sun, 01 Jun 2025 10:10:00 GMT'])
+        operators = {'=': operator.eq, '>=': operator.ge, '<': operator.lt}
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+
+        def respond(url, data, **kwargs):
+            params = orjson.loads(data)['params']
+            if params.get('method') == 'version':
+                return self._server_time_response(next(server_dates))
+            if params.get('method') != 'execute_kw':
+                return auth_response
+            model, operation, domain, page_kwargs = params['args'][3:7]
+            if model == 'res.country':
+                return self._countries_response()
+            conditions = [term for term in domain if term != '|']
+            matches = any if '|' in domain else all
+            matching = sorted(
+                partner_id for partner_id, write_date in write_dates.items()
+                if matches(operators[op](write_date, value) for _, op, value in conditions)
+            )
+            if operation == 'search_count':
+                return self._count_response(len(matching))
+            page = matching[page_kwargs['offset']:page_kwargs['offset'] + page_kwargs['limit']]
+            return self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=[{'id': partner_id, 'name': f'Partner {partner_id}'} for partner_id in page])
+
+        mock_post.side_effect = respond
+
+        self.cron_job.do()
+
+        self.assertEqual(list(OdooContact.objects.values_list('odoo_id', flat=True)), [1])
+
+        write_dates[2] = '2025-06-01 09:59:58'
+        self.cron_job.do()
+
+        self.assertEqual(sorted(OdooContact.objects.values_list('odoo_id', flat=True)), [1, 2])
+
+    @override_settings(ODOO_TRANSPORT='msgpack')
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_msgpack_transport(self, mock_post):
+        contact_list = [{'id': 70, 'name': 'Packed Seventy', 'country_id': 10}]
+
+        def msgpack_response(result_data):
+            mock_resp = MagicMock(spec=requests.Response)
+            mock_resp.status_code = 200
+            mock_resp.content = msgpack.packb({"jsonrpc": "2.0", "id": 1, "result": result_data}, use_bin_type=True)
+            mock_resp.raise_for_status.return_value = None
+            mock_resp.headers = {'Date': 'Mon, 02 Jun 2025 10:00:00 GMT'}
+            return mock_resp
+
+        def respond(url, data, **kwargs):
+            params = msgpack.unpackb(data, raw=False)['params']
+            if params.get('method') == 'version':
+                return msgpack_response(ODOO_VERSION_RESULT)
+            if params.get('method') != 'execute_kw':
+                return msgpack_response(123)
+            model, operation = params['args'][3:5]
+            if operation == 'search_count':
+                return msgpack_response(1)
+            if model == 'res.country':
+                return msgpack_response([{'id': 10, 'name': 'Testland'}])
+            return msgpack_response(contact_list)
+
+        mock_post.side_effect = respond
+
+        self.cron_job.do()
+
+        self.assertEqual(OdooContact.objects.get(odoo_id=70).country, 'Testland')
+
+    @override_settings(ODOO_TRANSPORT='xml')
+    @patch('odoo_sync.cron.requests.Session.post')
+    @patch('odoo_sync.cron.logger')
+    def test_unsupported_transport_setting(self, mock_logger, mock_post):
+        self.cron_job.do()
+
+        mock_post.assert_not_called()
+        self.assertIn("Unsupported ODOO_TRANSPORT setting: xml. Expected one of: json, msgpack", self._logged_messages(mock_logger.error))
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_odoo_false_clears_nullable_fields(self, mock_post):
+        OdooContact.objects.create(odoo_id=80, name='Eighty', email='eighty@example.com', phone='8080')
+        contact_list = [{
+            'id': 80, 'name': 'Eighty', 'email': False, 'phone': False,
+            'street': False, 'city': 'Eighty City', 'zip': False, 'country_id': False
+        }]
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(1), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        contact = OdooContact.objects.get(odoo_id=80)
+        self.assertIsNone(contact.email)
+        self.assertIsNone(contact.phone)
+        self.assertIsNone(contact.street)
+        self.assertIsNone(contact.zip_code)
+        self.assertEqual(contact.city, 'Eighty City')
+
+    @patch('odoo_sync.cron.aiohttp.ClientSession.post')
+    def test_async_sync_on_shared_session(self, mock_post):
+        mock_post.side_effect = self._fake_odoo_server({0: [{'id': 90, 'name': 'Ninety', 'country_id': 10}]}, count=1)
+
+        async def run_on_shared_session():
+            semaphore = asyncio.Semaphore(ODOO_SCHEDULER_CONCURRENCY)
+            async with SyncOdooContactsCronJob._a_build_session() as session:
+                await self.cron_job._async_do(session=session, semaphore=semaphore)
+                return session.closed, semaphore.locked()
+
+        session_closed, semaphore_locked = async_to_sync(run_on_shared_session)()
+
+        self.assertFalse(session_closed) # The job must leave the shared session open for the other jobs
+        self.assertFalse(semaphore_locked)
+        self.assertEqual(mock_post.call_count, 5)
+        self.assertEqual(OdooContact.objects.get(odoo_id=90).country, 'Testland')
+
+    def test_scheduler_registers_sync_jobs(self):
+        scheduler = build_scheduler(session=None, semaphore=None)
+
+        job = scheduler.get_job(SyncOdooContactsCronJob.code)
+        self.assertIsNotNone(job)
+        self.assertEqual(job.trigger.interval.total_seconds(), SyncOdooContactsCronJob.RUN_EVERY_MINS * 60)
+        self.assertIsInstance(job.args[0], SyncOdooContactsCronJob)
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    def test_missing_name_is_stored_empty(self, mock_post):
+        OdooContact.objects.create(odoo_id=91, name='Ninety-One')
+        contact_list = [
+            {'id': 91, 'name': False, 'city': 'Renamed City'},
+            {'id': 92}, # No name at all
+            {'id': 93, 'name': 'Ninety-Three'},
+        ]
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(3), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        self.assertEqual(OdooContact.objects.get(odoo_id=91).name, '')
+        self.assertEqual(OdooContact.objects.get(odoo_id=91).city, 'Renamed City')
+        self.assertEqual(OdooContact.objects.get(odoo_id=92).name, '')
+        self.assertEqual(OdooContact.objects.get(odoo_id=93).name, 'Ninety-Three')
+
+    @patch('odoo_sync.cron.requests.Session.post')
+    @patch('odoo_sync.cron.logger')
+    def test_invalid_row_is_skipped_without_failing_the_sync(self, mock_logger, mock_post):
+        contact_list = [
+            {'id': 94, 'name': 'Ninety-Four'},
+            {'id': 95, 'name': 'Ninety-Five', 'phone': '5' * 60}, # phone is varchar(50)
+            {'id': 96, 'name': 'Ninety-Six'},
+        ]
+        auth_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=123)
+        search_read_response = self._prepare_mock_response(200, is_jsonrpc_ok=True, result_data=contact_list)
+        mock_post.side_effect = [auth_response, self._server_time_response(), self._count_response(3), self._countries_response(), search_read_response]
+
+        self.cron_job.do()
+
+        self.assertEqual(sorted(OdooContact.objects.values_list('odoo_id', flat=True)), [94, 96])
+        self.assertIn("Skipping Odoo contact 95: phone is longer than 50 characters", self._logged_messages(mock_logger.error))
+        self.assertEqual(SyncCursor.objects.get(key='res.partner.write_date').value, '2025-06-02 09:50:00')
+        self.assertIn("Synchronization complete. 2 new contacts created, 0 contacts updated.", self._logged_messages(mock_logger.info))
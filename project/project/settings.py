@@ -45,6 +45,10 @@ ODOO_URL = 'YOUR_ODOO_URL'
 ODOO_DB = 'YOUR_ODOO_DATABASE'
 ODOO_USERNAME = 'YOUR_ODOO_USERNAME'
 ODOO_PASSWORD = 'YOUR_ODOO_PASSWORD'
+# Fetch from Odoo with aiohttp/asyncio instead of a threaded requests.Session
+ODOO_ASYNC = False
+# Wire format for JSON-RPC calls: 'json' (stock Odoo) or 'msgpack' (needs a MessagePack-capable endpoint)
+ODOO_TRANSPORT = 'json'
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',